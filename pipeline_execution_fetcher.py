@@ -5,14 +5,62 @@ Fetches pipeline execution data from Harness API and generates a CSV report.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import csv
 import argparse
 import sys
 import time
 import random
 import json
+import io
+import threading
+import functools
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
-from typing import List, Dict, Any
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlencode
+from typing import Callable, List, Dict, Any, Iterable, Iterator, NamedTuple, Tuple
+
+# orjson decodes large API responses much faster; fall back to the standard library
+try:
+    from orjson import loads as json_loads, dumps as json_dumps
+    JSON_BACKEND = 'orjson'
+except ImportError:
+    from json import loads as json_loads
+    JSON_BACKEND = 'json'
+    
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+# CSV report columns; parsed records are tuples in this order
+FIELDNAMES = (
+    'Pipeline',
+    'Project ID',
+    'Execution URL',
+    'Service Name',
+    'End Time',
+    'Start Time',
+    'Environment Name',
+    'Status',
+    'Duration'
+)
+
+# UI route of a project's pipelines; execution URLs append '<pipeline>/executions/<id>/pipeline'
+EXECUTION_URL_PREFIX = "{url_base}/ng/#/account/{account_id}/cd/orgs/{org_id}/projects/{project_id}/pipelines/"
+
+# Write buffer for the CSV report
+CSV_BUFFER_SIZE = 1024 * 1024
+
+# (connect, read) timeouts in seconds for API calls
+REQUEST_TIMEOUT = (5, 30)
+
+# Retry budget for 429/5xx/network failures: exponential backoff with full jitter
+MAX_ATTEMPTS = 8
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30.0
 
 
 def date_to_timestamp(date_str: str, end_of_day: bool = False) -> int:
@@ -108,6 +156,18 @@ def parse_arguments():
         type=int,
         help='End time in milliseconds (alternative to --end-date)'
     )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=8,
+        help='Number of pages fetched in parallel per project (default: 8)'
+    )
+    parser.add_argument(
+        '--project-workers',
+        type=int,
+        default=8,
+        help='Number of projects processed in parallel (default: 8)'
+    )
     
     args = parser.parse_args()
     
@@ -118,6 +178,12 @@ def parse_arguments():
     if args.auth_token and args.api_key:
         parser.error("Cannot use both --auth-token and --api-key. Please provide only one.")
     
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    
+    if args.project_workers < 1:
+        parser.error("--project-workers must be at least 1")
+    
     # Convert dates to timestamps if provided
     if args.start_date:
         args.start_time = date_to_timestamp(args.start_date, end_of_day=False)
@@ -134,57 +200,147 @@ def parse_arguments():
     return args
 
 
+class FetchCancelled(Exception):
+    """Raised in worker threads once the run has been stopped."""
+
+
+# Set when the run stops (a project failed or Ctrl-C) so worker threads unwind
+stop_event = threading.Event()
+
+
+def check_stopped():
+    """Raise FetchCancelled if the run has been stopped."""
+    if stop_event.is_set():
+        raise FetchCancelled("Run stopped")
+
+
+class AdaptiveThrottle:
+    """
+    One schedule of API call slots shared by all worker threads.
+    
+    Each call reserves the next free slot, so calls from every thread start at
+    least the current delay apart. The delay shrinks by 10% after every
+    successful response and doubles when the API rate limits or fails, so
+    calls run as fast as the API allows.
+    """
+    
+    def __init__(self, min_delay: float = 0.05, max_delay: float = 5.0):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.current_delay = min_delay
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self):
+        """Reserve the next call slot (current delay plus up to 50% jitter) and sleep until it."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_at)
+            delay = self.current_delay
+            self._next_at = slot + delay + random.uniform(0, delay * 0.5)
+        # Wake early if the run is stopped while waiting for the slot
+        if slot > now:
+            stop_event.wait(slot - now)
+        check_stopped()
+    
+    def record(self, status_code: int):
+        """Adjust the delay based on the status code of a response."""
+        with self._lock:
+            if status_code == 429 or status_code >= 500:
+                self.current_delay = min(self.max_delay, self.current_delay * 2.0)
+            elif status_code < 400:
+                self.current_delay = max(self.min_delay, self.current_delay * 0.9)
+
+
+# Paces every API call made by this script
+throttle = AdaptiveThrottle()
+
+
+def create_session(auth_token: str = None, api_key: str = None, pool_size: int = 32) -> requests.Session:
+    """
+    Create an HTTP session with pooled keep-alive connections and auth headers.
+    
+    Args:
+        auth_token: Authorization header value (optional if api_key is provided)
+        api_key: API key for x-api-key header (optional)
+        pool_size: Maximum number of connections kept open to the API host
+    
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    
+    # Retries are handled by the fetch functions, not by urllib3.
+    # Blocking on a full pool makes worker threads wait for a kept-alive
+    # connection instead of opening one that is discarded after a single request.
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_size, pool_block=True, max_retries=0)
+    session.mount('https://', adapter)
+    
+    # Build headers based on authentication method
+    if api_key:
+        session.headers.update({'x-api-key': api_key})
+    else:
+        session.headers.update({'Authorization': auth_token})
+    session.headers.update({'Content-Type': 'application/json'})
+    # requests already sends "Accept-Encoding: gzip, deflate" (plus br when the
+    # brotli package is installed) and decompresses responses transparently
+    
+    return session
+
+
+@functools.lru_cache(maxsize=None)
+def build_projects_url(base_url: str, account_id: str, org_id: str, page_size: int) -> str:
+    """
+    Build the projects API URL up to the page index; callers append the page.
+    
+    Args:
+        base_url: Base URL for the API
+        account_id: Account identifier
+        org_id: Organization identifier (optional)
+        page_size: Number of records per page
+    
+    Returns:
+        URL ending in "pageIndex="
+    """
+    params = {
+        'routingId': account_id,
+        'accountIdentifier': account_id,
+        'pageSize': page_size,
+        'sortOrders': 'lastModifiedAt,DESC',
+        'onlyFavorites': 'false'
+    }
+    if org_id:
+        params['orgIdentifier'] = org_id
+    return f"{base_url}/ng/api/aggregate/projects?{urlencode(params, safe=',')}&pageIndex="
+
+
 def fetch_projects(
+    session: requests.Session,
     base_url: str,
-    auth_token: str,
     account_id: str,
     org_id: str,
     page_index: int = 0,
-    page_size: int = 20,
-    api_key: str = None
+    page_size: int = 20
 ) -> Dict[str, Any]:
     """
     Fetch projects for a specific organization.
     
     Args:
+        session: HTTP session carrying the authentication headers
         base_url: Base URL for the API
-        auth_token: Bearer authentication token (optional if api_key is provided)
         account_id: Account identifier
         org_id: Organization identifier
         page_index: Page index (0-indexed)
         page_size: Number of records per page
-        api_key: API key for x-api-key header (optional)
     
     Returns:
         API response as dictionary
     """
-    url = (
-        f"{base_url}/ng/api/aggregate/projects"
-        f"?routingId={account_id}"
-        f"&accountIdentifier={account_id}"
-        f"&pageIndex={page_index}"
-        f"&pageSize={page_size}"
-        f"&sortOrders=lastModifiedAt,DESC"
-        f"&onlyFavorites=false"
-    )
-    
-    if org_id:
-        url += f"&orgIdentifier={org_id}"
-    
-    # Build headers based on authentication method
-    if api_key:
-        headers = {'x-api-key': api_key}
-    else:
-        headers = {'Authorization': auth_token}
+    url = build_projects_url(base_url, account_id, org_id, page_size) + str(page_index)
     
     try:
-        response = requests.get(
-            url,
-            headers=headers
-        )
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        return request_json(session, 'GET', url)
+    except (requests.exceptions.RequestException, ValueError) as e:
         print(f"\nError fetching projects: {e}", file=sys.stderr)
         print(f"\nSample curl command to debug:", file=sys.stderr)
         print(f"curl --location '{url}' \\", file=sys.stderr)
@@ -192,104 +348,191 @@ def fetch_projects(
         raise
 
 
-def fetch_pipeline_executions(
-    base_url: str,
-    auth_token: str,
-    account_id: str,
-    org_id: str,
-    project_id: str,
-    page: int,
-    page_size: int,
-    start_time: int,
-    end_time: int,
-    api_key: str = None
-) -> Dict[str, Any]:
+def get_retry_after(response) -> float:
     """
-    Fetch pipeline execution data for a specific page.
+    Read the Retry-After header of a response.
+    
+    Args:
+        response: HTTP response (may be None)
+    
+    Returns:
+        Delay in seconds, or None if the header is missing or invalid
+    """
+    if response is None:
+        return None
+    
+    retry_after = response.headers.get('Retry-After')
+    if not retry_after:
+        return None
+    
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    
+    # Retry-After may also be an HTTP date
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def build_execution_url(base_url: str, account_id: str, org_id: str, project_id: str, page_size: int) -> str:
+    """
+    Build the pipeline execution summary API URL up to the page number; callers append the page.
     
     Args:
         base_url: Base URL for the API
-        auth_token: Bearer authentication token
         account_id: Account identifier
         org_id: Organization identifier
         project_id: Project identifier
-        page: Page number (0-indexed)
         page_size: Number of records per page
-        start_time: Start time in milliseconds
-        end_time: End time in milliseconds
     
     Returns:
-        API response as dictionary
+        URL ending in "page="
     """
-    url = (
-        f"{base_url}/pipeline/api/pipelines/execution/summary"
-        f"?routingId={account_id}"
-        f"&accountIdentifier={account_id}"
-        f"&projectIdentifier={project_id}"
-        f"&orgIdentifier={org_id}"
-        f"&page={page}"
-        f"&size={page_size}"
-        f"&sort=startTs,DESC"
-        f"&myDeployments=false"
-        f"&searchTerm="
-        f"&module=cd"
-    )
+    query = urlencode({
+        'routingId': account_id,
+        'accountIdentifier': account_id,
+        'projectIdentifier': project_id,
+        'orgIdentifier': org_id,
+        'size': page_size,
+        'sort': 'startTs,DESC',
+        'myDeployments': 'false',
+        'searchTerm': '',
+        'module': 'cd'
+    }, safe=',')
+    return f"{base_url}/pipeline/api/pipelines/execution/summary?{query}&page="
+
+
+@functools.lru_cache(maxsize=None)
+def build_execution_payload(start_time: int, end_time: int) -> bytes:
+    """
+    Build the JSON request body for the pipeline execution summary API.
+    The body only depends on the time range, so it is encoded once per range.
+    Executions without a Production environment are filtered out by the API;
+    stages are still filtered client-side in extract_stage_data.
     
-    # Build headers based on authentication method
-    if api_key:
-        headers = {
-            'x-api-key': api_key,
-            'Content-Type': 'application/json'
-        }
-    else:
-        headers = {
-            'Authorization': auth_token,
-            'Content-Type': 'application/json'
-        }
+    Args:
+        start_time: Start time in milliseconds
+        end_time: End time in milliseconds
     
+    Returns:
+        Encoded JSON payload
+    """
     payload = {
         "filterType": "PipelineExecution",
+        "moduleProperties": {
+            "cd": {
+                "environmentTypes": ["Production"]
+            }
+        },
         "timeRange": {
             "startTime": start_time,
             "endTime": end_time
         }
     }
+    return json_dumps(payload)
+
+
+def request_json(session: requests.Session, method: str, url: str, **kwargs) -> Dict[str, Any]:
+    """
+    Send an API request and decode its JSON body, retrying transient failures.
+    
+    Rate limiting (429), server errors (5xx) and network failures are retried
+    with exponential backoff and full jitter, honoring Retry-After when the
+    server sends it. Any other error is raised immediately.
     
-    # Retry logic with 3 attempts
-    max_retries = 3
-    for attempt in range(max_retries):
+    Args:
+        session: HTTP session carrying the authentication headers
+        method: HTTP method
+        url: Request URL
+        **kwargs: Extra arguments passed to session.request (e.g. data)
+    
+    Returns:
+        API response as dictionary
+    """
+    for attempt in range(MAX_ATTEMPTS):
         try:
-            response = requests.post(
-                url,
-                headers=headers,
-                json=payload,
-                timeout=30
-            )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            response = session.request(method, url, timeout=REQUEST_TIMEOUT, **kwargs)
+            throttle.record(response.status_code)
+            # Compare the status directly; raise_for_status() costs more on every successful call
+            if response.status_code >= 400:
+                raise requests.HTTPError(f"{response.status_code} Error: {response.reason} for url: {url}", response=response)
+            return json_loads(response.content)
+        except (requests.exceptions.RequestException, ValueError) as e:
             # Try to get response body for more details
             error_details = ""
-            if hasattr(e, 'response') and e.response is not None:
+            response = getattr(e, 'response', None)
+            if response is not None:
                 try:
-                    error_body = e.response.text
+                    error_body = response.text
                     error_details = f"\nResponse body: {error_body[:500]}"
                 except:
                     pass
             
-            if attempt < max_retries - 1:
-                wait_time = (attempt + 1) * 2  # 2, 4, 6 seconds
-                print(f"\n  Warning: API call failed (attempt {attempt + 1}/{max_retries}): {e}{error_details}", file=sys.stderr)
-                print(f"  Retrying in {wait_time} seconds...", file=sys.stderr)
-                time.sleep(wait_time)
-            else:
-                print(f"\nError fetching pipeline executions after {max_retries} attempts: {e}{error_details}", file=sys.stderr)
-                print(f"\nSample curl command to debug:", file=sys.stderr)
-                print(f"curl --location '{url}' \\", file=sys.stderr)
-                print(f"  --header 'Authorization: <YOUR_AUTH_TOKEN>' \\", file=sys.stderr)
-                print(f"  --header 'Content-Type: application/json' \\", file=sys.stderr)
-                print(f"  --data '{json.dumps(payload)}'", file=sys.stderr)
+            # Only rate limiting, server errors and network failures are worth retrying
+            status_code = response.status_code if response is not None else None
+            retryable = status_code is None or status_code == 429 or status_code >= 500
+            
+            if not retryable or attempt == MAX_ATTEMPTS - 1:
+                print(f"\n  API call failed after {attempt + 1} attempt(s): {e}{error_details}", file=sys.stderr)
                 raise
+            
+            wait_time = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** attempt)))
+            retry_after = get_retry_after(response)
+            if retry_after is not None:
+                wait_time = max(retry_after, wait_time)
+            print(f"\n  Warning: API call failed (attempt {attempt + 1}/{MAX_ATTEMPTS}): {e}{error_details}", file=sys.stderr)
+            print(f"  Retrying in {wait_time:.1f} seconds...", file=sys.stderr)
+            if stop_event.wait(wait_time):
+                raise FetchCancelled("Run stopped")
+
+
+def fetch_pipeline_executions(
+    session: requests.Session,
+    base_url: str,
+    account_id: str,
+    org_id: str,
+    project_id: str,
+    page: int,
+    page_size: int,
+    start_time: int,
+    end_time: int
+) -> Dict[str, Any]:
+    """
+    Fetch pipeline execution data for a specific page.
+    
+    Args:
+        session: HTTP session carrying the authentication headers
+        base_url: Base URL for the API
+        account_id: Account identifier
+        org_id: Organization identifier
+        project_id: Project identifier
+        page: Page number (0-indexed)
+        page_size: Number of records per page
+        start_time: Start time in milliseconds
+        end_time: End time in milliseconds
+    
+    Returns:
+        API response as dictionary
+    """
+    url = build_execution_url(base_url, account_id, org_id, project_id, page_size) + str(page)
+    
+    payload = build_execution_payload(start_time, end_time)
+    
+    try:
+        return request_json(session, 'POST', url, data=payload)
+    except (requests.exceptions.RequestException, ValueError) as e:
+        print(f"\nError fetching pipeline executions: {e}", file=sys.stderr)
+        print(f"\nSample curl command to debug:", file=sys.stderr)
+        print(f"curl --location '{url}' \\", file=sys.stderr)
+        print(f"  --header 'Authorization: <YOUR_AUTH_TOKEN>' \\", file=sys.stderr)
+        print(f"  --header 'Content-Type: application/json' \\", file=sys.stderr)
+        print(f"  --data '{payload.decode('utf-8')}'", file=sys.stderr)
+        raise
 
 
 def extract_stage_data(layout_node_map: Dict[str, Any], env_filter: str = "Production", execution_id: str = "") -> List[Dict[str, Any]]:
@@ -309,46 +552,81 @@ def extract_stage_data(layout_node_map: Dict[str, Any], env_filter: str = "Produ
     if not layout_node_map:
         return stages
     
-    for node_id, node_data in layout_node_map.items():
-        module_info = node_data.get('moduleInfo', {})
+    stages_append = stages.append
+    
+    for node_data in layout_node_map.values():
+        get = node_data.get
         
-        # Check if this node has CD module info
-        if 'cd' in module_info and module_info['cd']:
-            # Filter by environment type
-            env_type = module_info.get('cd', {}).get('infraExecutionSummary', {}).get('type')
-            env_name = module_info.get('cd', {}).get('infraExecutionSummary', {}).get('name', '')
-            
-            # Check if it's a Production environment (not PreProduction)
-            if env_type == env_filter:
-                # Get service name, leave blank if serviceInfo is null/missing
-                service_info = module_info.get('cd', {}).get('serviceInfo')
-                if service_info and isinstance(service_info, dict):
-                    service_name = service_info.get('displayName', '')
-                else:
-                    service_name = ''
-                
-                stage_info = {
-                    'stage_name': node_data.get('name', ''),
-                    'start_time': node_data.get('startTs'),
-                    'end_time': node_data.get('endTs'),
-                    'status': node_data.get('status', ''),
-                    'environment_name': env_name,
-                    'service_name': service_name
-                }
-                stages.append(stage_info)
+        # Skip nodes without CD module info (CI, approval and custom stages)
+        module_info = get('moduleInfo')
+        if not module_info:
+            continue
+        cd = module_info.get('cd')
+        if not cd:
+            continue
+        
+        # Check if it's a Production environment (not PreProduction)
+        infra = cd.get('infraExecutionSummary')
+        if not infra or infra.get('type') != env_filter:
+            continue
+        
+        # Get service name, leave blank if serviceInfo is null/missing
+        service_info = cd.get('serviceInfo')
+        service_name = service_info.get('displayName', '') if isinstance(service_info, dict) else ''
+        
+        stages_append({
+            'stage_name': get('name', ''),
+            'start_time': get('startTs'),
+            'end_time': get('endTs'),
+            'status': get('status', ''),
+            'environment_name': infra.get('name', ''),
+            'service_name': service_name
+        })
     
     return stages
 
 
+# "YYYY-MM-DD " prefixes keyed by days since the epoch; executions cluster in a few days
+_date_prefix_cache: Dict[int, str] = {}
+
+
+def _civil_from_days(days: int) -> Tuple[int, int, int]:
+    """
+    Convert days since 1970-01-01 to a proleptic Gregorian (year, month, day).
+    
+    Integer-only port of Howard Hinnant's civil_from_days algorithm.
+    """
+    z = days + 719468
+    era = z // 146097
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = mp + 3 if mp < 10 else mp - 9
+    year = yoe + era * 400 + (month <= 2)
+    return year, month, day
+
+
 def format_timestamp(timestamp_ms: int) -> str:
     """Convert millisecond timestamp to readable format in UTC."""
     if not timestamp_ms:
         return ''
     try:
-        dt = datetime.fromtimestamp(timestamp_ms / 1000.0, tz=timezone.utc)
-        return dt.strftime('%Y-%m-%d %H:%M:%S')
+        days, ms_of_day = divmod(int(timestamp_ms), 86400000)
+        date_prefix = _date_prefix_cache.get(days)
+        if date_prefix is None:
+            date_prefix = '%04d-%02d-%02d ' % _civil_from_days(days)
+            _date_prefix_cache[days] = date_prefix
+        
+        minutes, seconds = divmod(ms_of_day // 1000, 60)
+        hours, minutes = divmod(minutes, 60)
+        return date_prefix + '%02d:%02d:%02d' % (hours, minutes, seconds)
     except:
-        return ''
+        try:
+            return datetime.fromtimestamp(timestamp_ms / 1000.0, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+        except:
+            return ''
 
 
 def calculate_duration(start_ts: int, end_ts: int) -> str:
@@ -356,37 +634,65 @@ def calculate_duration(start_ts: int, end_ts: int) -> str:
     if not start_ts or not end_ts:
         return ''
     
-    duration_ms = end_ts - start_ts
-    duration_seconds = int(duration_ms / 1000.0)
+    # Whole seconds, truncated toward zero
+    duration_ms = int(end_ts) - int(start_ts)
+    duration_seconds = abs(duration_ms) // 1000
+    if duration_ms < 0:
+        duration_seconds = -duration_seconds
     
-    hours = duration_seconds // 3600
-    minutes = (duration_seconds % 3600) // 60
-    seconds = duration_seconds % 60
+    hours, remainder = divmod(duration_seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
     
     return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
 
-def parse_execution_data(response_data: Dict[str, Any], base_url: str, account_id: str, org_id: str, project_id: str) -> List[Dict[str, str]]:
+class ProjectContext(NamedTuple):
+    """Per-project values shared by every record of a project."""
+    project_id: str
+    url_prefix: str
+
+
+def build_project_context(base_url: str, account_id: str, org_id: str, project_id: str) -> ProjectContext:
     """
-    Parse execution data from API response and extract relevant fields.
+    Precompute the per-project values used while parsing executions.
     
     Args:
-        response_data: API response data
         base_url: Base URL for constructing execution URLs
         account_id: Account identifier
         org_id: Organization identifier
         project_id: Project identifier
     
     Returns:
-        List of parsed execution records
+        ProjectContext for the project
+    """
+    # Construct execution URL prefix (remove /gateway if present in base_url)
+    url_base = base_url.replace('/gateway', '')
+    url_prefix = EXECUTION_URL_PREFIX.format(
+        url_base=url_base, account_id=account_id, org_id=org_id, project_id=project_id
+    )
+    return ProjectContext(project_id=project_id, url_prefix=url_prefix)
+
+
+def parse_execution_data(response_data: Dict[str, Any], context: ProjectContext) -> Iterator[Tuple[str, ...]]:
+    """
+    Parse execution data from API response and extract relevant fields.
+    Records are yielded one at a time so they can be written as they are produced.
+    
+    Args:
+        response_data: API response data
+        context: Per-project values from build_project_context
+    
+    Yields:
+        Parsed execution records as tuples in FIELDNAMES order
     """
-    records = []
+    project_id = context.project_id
+    url_prefix = context.url_prefix
     
     content = response_data.get('data', {}).get('content', [])
     
     for execution in content:
-        pipeline_identifier = execution.get('pipelineIdentifier', '')
-        execution_id = execution.get('planExecutionId', '')
+        pipeline_identifier = execution.get('pipelineIdentifier') or ''
+        execution_id = execution.get('planExecutionId') or ''
         layout_node_map = execution.get('layoutNodeMap', {})
         
         # Get execution-level timestamps
@@ -400,312 +706,341 @@ def parse_execution_data(response_data: Dict[str, Any], base_url: str, account_i
         if not stages:
             continue
         
+        # Execution-level fields are shared by all of its stages
+        pipeline_name = execution.get('name', '')
+        execution_url = url_prefix + pipeline_identifier + '/executions/' + execution_id + '/pipeline'
+        start_str = format_timestamp(execution_start_time)
+        end_str = format_timestamp(execution_end_time)
+        duration_str = calculate_duration(execution_start_time, execution_end_time)
+        
         # Create a record for each stage
         for stage in stages:
-            # Construct execution URL (remove /gateway if present in base_url)
-            url_base = base_url.replace('/gateway', '')
-            execution_url = (
-                f"{url_base}/ng/#/account/{account_id}/cd/orgs/{org_id}/projects/{project_id}"
-                f"/pipelines/{pipeline_identifier}/executions/{execution_id}/pipeline"
+            yield (
+                pipeline_name,
+                project_id,
+                execution_url,
+                stage['service_name'],
+                end_str,
+                start_str,
+                stage['environment_name'],
+                stage['status'],
+                duration_str
             )
-            
-            record = {
-                'Pipeline': execution.get('name', ''),
-                'Project ID': project_id,
-                'Execution URL': execution_url,
-                'Service Name': stage['service_name'],
-                'End Time': format_timestamp(execution_end_time),
-                'Start Time': format_timestamp(execution_start_time),
-                'Environment Name': stage['environment_name'],
-                'Status': stage['status'],
-                'Duration': calculate_duration(execution_start_time, execution_end_time)
-            }
-            records.append(record)
+
+
+class CsvStreamWriter:
+    """
+    Streams report rows into a CSV file as they are parsed.
     
-    return records
+    The file is opened behind a large write buffer and the header is written on
+    entry. Rows may be written from several threads; each batch is written
+    under a lock so rows of one page stay together.
+    """
+    
+    def __init__(self, output_file: str, fieldnames: Iterable[str]):
+        self.output_file = output_file
+        self.fieldnames = tuple(fieldnames)
+        self._file = None
+        self._writer = None
+        self._lock = threading.Lock()
+    
+    def __enter__(self) -> 'CsvStreamWriter':
+        raw = open(self.output_file, 'wb', buffering=0)
+        buffered = io.BufferedWriter(raw, buffer_size=CSV_BUFFER_SIZE)
+        self._file = io.TextIOWrapper(buffered, encoding='utf-8', newline='', write_through=False)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.fieldnames)
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._file.close()
+    
+    def write_rows(self, records: Iterable[Tuple[str, ...]]) -> int:
+        """
+        Write records to the report.
+        
+        Records are collected first so that the lock is held once per batch of
+        rows rather than while they are being parsed.
+        
+        Args:
+            records: Iterable of record tuples in fieldnames order
+        
+        Returns:
+            Number of records written
+        """
+        rows = list(records)
+        with self._lock:
+            self._writer.writerows(rows)
+        return len(rows)
 
 
-def write_to_csv(records: List[Dict[str, str]], output_file: str, mode: str = 'w'):
+def fetch_pages_in_order(
+    executor: ThreadPoolExecutor,
+    fetch_page: Callable[[int], Dict[str, Any]],
+    pages: Iterable[int],
+    window: int
+) -> Iterator[Dict[str, Any]]:
     """
-    Write records to CSV file.
+    Fetch pages in the background and yield them in page order.
+    
+    At most `window` pages are requested ahead of the consumer, so a slow or
+    retried page never lets finished pages pile up in memory behind it.
     
     Args:
-        records: List of record dictionaries
-        output_file: Output CSV file path
-        mode: File mode - 'w' for write (with header), 'a' for append (no header)
-    """
-    if not records:
-        return
-    
-    fieldnames = [
-        'Pipeline',
-        'Project ID',
-        'Execution URL',
-        'Service Name',
-        'End Time',
-        'Start Time',
-        'Environment Name',
-        'Status',
-        'Duration'
-    ]
-    
-    with open(output_file, mode, newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        if mode == 'w':
-            writer.writeheader()
-        writer.writerows(records)
-    
-    if mode == 'w':
-        print(f"Created CSV file: {output_file}")
-    else:
-        print(f"Appended {len(records)} records to {output_file}")
+        executor: Thread pool that runs the requests
+        fetch_page: Function returning the response for a page number
+        pages: Page numbers to fetch, in order
+        window: Maximum number of pages requested ahead
+    
+    Yields:
+        API responses in page order
+    """
+    pages = iter(pages)
+    pending = deque(executor.submit(fetch_page, page) for page in itertools.islice(pages, max(1, window)))
+    while pending:
+        response_data = pending.popleft().result()
+        # Refill the window before handing the page to the consumer
+        for page in itertools.islice(pages, 1):
+            pending.append(executor.submit(fetch_page, page))
+        yield response_data
 
 
-def fetch_all_projects(base_url: str, auth_token: str, account_id: str, org_id: str, api_key: str = None) -> List[str]:
+def fetch_all_projects(session: requests.Session, base_url: str, account_id: str, org_id: str, concurrency: int = 8) -> List[str]:
     """
     Fetch all projects for an organization.
+    Once the first page reports the page count, the remaining pages are
+    fetched in parallel, a bounded number ahead of the one being read.
     
     Args:
+        session: HTTP session carrying the authentication headers
         base_url: Base URL for the API
-        auth_token: Bearer authentication token
         account_id: Account identifier
         org_id: Organization identifier
-        api_key: API key for x-api-key header (optional)
+        concurrency: Maximum number of pages fetched in parallel
     
     Returns:
         List of project identifiers
     """
     all_projects = []
-    page_index = 0
     
     print("Fetching all projects...")
     
-    while True:
-        response_data = fetch_projects(
+    def fetch_page(page_index: int) -> Dict[str, Any]:
+        # Pages after the first take the next slot on the throttle's host-wide schedule
+        check_stopped()
+        if page_index > 0:
+            throttle.wait()
+        return fetch_projects(
+            session=session,
             base_url=base_url,
-            auth_token=auth_token,
             account_id=account_id,
             org_id=org_id,
             page_index=page_index,
-            page_size=20,
-            api_key=api_key
+            page_size=20
         )
+    
+    response_data = fetch_page(0)
+    total_pages = response_data.get('data', {}).get('totalPages', 0)
+    
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        remaining_pages = fetch_pages_in_order(executor, fetch_page, range(1, total_pages), concurrency)
         
-        content = response_data.get('data', {}).get('content', [])
-        page_info = response_data.get('data', {})
-        total_pages = page_info.get('totalPages', 0)
-        
-        for project in content:
-            project_identifier = project.get('projectResponse', {}).get('project', {}).get('identifier')
-            if project_identifier:
-                all_projects.append(project_identifier)
-        
-        print(f"  Page {page_index}: Found {len(content)} projects")
-        
-        if page_index >= total_pages - 1:
-            break
-        
-        page_index += 1
-        
-        # Add random delay between 0.5 to 1 second
-        if page_index < total_pages:
-            delay = random.uniform(0.5, 1.0)
-            time.sleep(delay)
+        for page_index, response_data in enumerate(itertools.chain([response_data], remaining_pages)):
+            content = response_data.get('data', {}).get('content', [])
+            
+            for project in content:
+                project_identifier = project.get('projectResponse', {}).get('project', {}).get('identifier')
+                if project_identifier:
+                    all_projects.append(project_identifier)
+            
+            print(f"  Page {page_index}: Found {len(content)} projects")
     
     print(f"Total projects found: {len(all_projects)}")
     return all_projects
 
 
 def fetch_project_executions_batch(
+    session: requests.Session,
     base_url: str,
-    auth_token: str,
     account_id: str,
     org_id: str,
     project_id: str,
     page_size: int,
     start_time: int,
     end_time: int,
-    api_key: str = None,
-    batch_label: str = ""
-) -> List[Dict[str, str]]:
+    writer: CsvStreamWriter,
+    context: ProjectContext,
+    batch_label: str = "",
+    prefetch_pages: int = 1,
+    initial_page: Dict[str, Any] = None
+) -> int:
     """
     Fetch pipeline executions for a specific project within a time range batch.
+    The next pages are requested in the background while the current one is parsed.
     
     Args:
+        session: HTTP session carrying the authentication headers
         base_url: Base URL for the API
-        auth_token: Bearer authentication token
         account_id: Account identifier
         org_id: Organization identifier
         project_id: Project identifier
         page_size: Number of records per page
         start_time: Start time in milliseconds
         end_time: End time in milliseconds
-        api_key: API key for authentication
+        writer: CsvStreamWriter that receives the parsed records
+        context: Per-project values from build_project_context
         batch_label: Label for the batch (for logging)
+        prefetch_pages: Number of pages requested ahead of the one being parsed
+        initial_page: Already fetched page 0 of this batch (optional)
     
     Returns:
-        List of execution records
+        Number of records written
     """
-    all_records = []
-    page = 0
-    total_pages = None
-    total_elements = None
+    batch_count = 0
     
-    while True:
-        response_data = fetch_pipeline_executions(
+    def fetch_page(page: int) -> Dict[str, Any]:
+        check_stopped()
+        # Every page takes the next slot on the throttle's host-wide schedule
+        throttle.wait()
+        return fetch_pipeline_executions(
+            session=session,
             base_url=base_url,
-            auth_token=auth_token,
             account_id=account_id,
             org_id=org_id,
             project_id=project_id,
             page=page,
             page_size=page_size,
             start_time=start_time,
-            end_time=end_time,
-            api_key=api_key
+            end_time=end_time
         )
-        
-        # Get pagination info
-        page_info = response_data.get('data', {})
-        total_pages = page_info.get('totalPages', 0)
-        total_elements = page_info.get('totalElements', 0)
-        
-        # Print pagination info on first page
-        if page == 0:
-            batch_info = f" [{batch_label}]" if batch_label else ""
-            print(f"  Total pages: {total_pages}, Total executions: {total_elements}{batch_info}")
-        
-        # Parse and collect records
-        records = parse_execution_data(
-            response_data,
-            base_url,
-            account_id,
-            org_id,
-            project_id
+    
+    if initial_page is not None:
+        response_data = initial_page
+    else:
+        response_data = fetch_pipeline_executions(
+            session=session,
+            base_url=base_url,
+            account_id=account_id,
+            org_id=org_id,
+            project_id=project_id,
+            page=0,
+            page_size=page_size,
+            start_time=start_time,
+            end_time=end_time
         )
-        all_records.extend(records)
-        
-        # Print progress
-        print(f"  Processing page {page + 1}/{total_pages} - Found {len(records)} production stage records on this page")
-        
-        # Check if this is the last page
-        if page >= total_pages - 1 or total_pages == 0:
-            break
-        
-        page += 1
+    
+    # Get pagination info
+    page_info = response_data.get('data', {})
+    total_pages = page_info.get('totalPages', 0)
+    total_elements = page_info.get('totalElements', 0)
+    
+    batch_info = f" [{batch_label}]" if batch_label else ""
+    print(f"  [{project_id}] Total pages: {total_pages}, Total executions: {total_elements}{batch_info}")
+    
+    with ThreadPoolExecutor(max_workers=max(1, prefetch_pages)) as executor:
+        remaining_pages = fetch_pages_in_order(executor, fetch_page, range(1, total_pages), prefetch_pages)
         
-        # Add random delay between 0.5 to 1 second
-        if page < total_pages:
-            delay = random.uniform(0.5, 1.0)
-            time.sleep(delay)
+        for page, response_data in enumerate(itertools.chain([response_data], remaining_pages)):
+            check_stopped()
+            
+            # Parse and write records
+            page_count = writer.write_rows(parse_execution_data(
+                response_data,
+                context
+            ))
+            batch_count += page_count
+            
+            # Print progress
+            print(f"  [{project_id}] Processing page {page + 1}/{total_pages} - Found {page_count} production stage records on this page")
     
-    return all_records
+    return batch_count
 
 
 def fetch_project_executions(
+    session: requests.Session,
     base_url: str,
-    auth_token: str,
     account_id: str,
     org_id: str,
     project_id: str,
     page_size: int,
     start_time: int,
     end_time: int,
-    api_key: str = None
-) -> List[Dict[str, str]]:
+    writer: CsvStreamWriter,
+    concurrency: int = 8
+) -> int:
     """
     Fetch all pipeline executions for a specific project.
     Automatically splits into batches if total count exceeds 10k.
+    The total count is read from a probe request, after which pages are
+    fetched in parallel, a bounded number ahead of the one being written.
     
     Args:
+        session: HTTP session carrying the authentication headers
         base_url: Base URL for the API
-        auth_token: Bearer authentication token
         account_id: Account identifier
         org_id: Organization identifier
         project_id: Project identifier
         page_size: Number of records per page
         start_time: Start time in milliseconds
         end_time: End time in milliseconds
-        api_key: API key for authentication
+        writer: CsvStreamWriter that receives the parsed records
+        concurrency: Maximum number of pages fetched in parallel
     
     Returns:
-        List of execution records
+        Number of records written
     """
+    context = build_project_context(base_url, account_id, org_id, project_id)
+    batch_size_ms = 10 * 24 * 60 * 60 * 1000  # 10 days in milliseconds
+    
+    # The probe is a full page 0 of the whole range. It is reused as page 0 unless
+    # the range is split into batches, whose first pages differ from it.
+    single_batch = end_time - start_time < batch_size_ms
+    
     # First, check the total count
-    response_data = fetch_pipeline_executions(
+    probe_data = fetch_pipeline_executions(
+        session=session,
         base_url=base_url,
-        auth_token=auth_token,
         account_id=account_id,
         org_id=org_id,
         project_id=project_id,
         page=0,
         page_size=page_size,
         start_time=start_time,
-        end_time=end_time,
-        api_key=api_key
+        end_time=end_time
     )
     
-    page_info = response_data.get('data', {})
-    total_elements = page_info.get('totalElements', 0)
+    total_elements = probe_data.get('data', {}).get('totalElements', 0)
     
     # If total elements <= 10k, fetch normally
     if total_elements <= 10000:
-        print(f"  Total executions: {total_elements} (within limit)")
+        print(f"  [{project_id}] Total executions: {total_elements} (within limit)")
         
-        # Parse first page
-        all_records = parse_execution_data(
-            response_data,
-            base_url,
-            account_id,
-            org_id,
-            project_id
+        return fetch_project_executions_batch(
+            session=session,
+            base_url=base_url,
+            account_id=account_id,
+            org_id=org_id,
+            project_id=project_id,
+            page_size=page_size,
+            start_time=start_time,
+            end_time=end_time,
+            writer=writer,
+            context=context,
+            prefetch_pages=concurrency,
+            initial_page=probe_data
         )
-        
-        total_pages = page_info.get('totalPages', 0)
-        print(f"  Processing page 1/{total_pages} - Found {len(all_records)} production stage records on this page")
-        
-        # Fetch remaining pages
-        for page in range(1, total_pages):
-            response_data = fetch_pipeline_executions(
-                base_url=base_url,
-                auth_token=auth_token,
-                account_id=account_id,
-                org_id=org_id,
-                project_id=project_id,
-                page=page,
-                page_size=page_size,
-                start_time=start_time,
-                end_time=end_time,
-                api_key=api_key
-            )
-            
-            records = parse_execution_data(
-                response_data,
-                base_url,
-                account_id,
-                org_id,
-                project_id
-            )
-            all_records.extend(records)
-            
-            print(f"  Processing page {page + 1}/{total_pages} - Found {len(records)} production stage records on this page")
-            
-            # Add random delay
-            delay = random.uniform(0.5, 1.0)
-            time.sleep(delay)
-        
-        return all_records
     
     # If total elements > 10k, split into 10-day batches
-    print(f"  Total executions: {total_elements} (exceeds 10k limit)")
-    print(f"  Splitting time range into 10-day batches...")
+    print(f"  [{project_id}] Total executions: {total_elements} (exceeds 10k limit)")
+    print(f"  [{project_id}] Splitting time range into 10-day batches...")
     
-    all_records = []
-    batch_size_ms = 10 * 24 * 60 * 60 * 1000  # 10 days in milliseconds
+    project_count = 0
     current_start = start_time
     batch_num = 1
     
     while current_start < end_time:
+        check_stopped()
+        
         # Calculate batch end time (inclusive, so subtract 1ms from next batch start)
         current_end = min(current_start + batch_size_ms - 1, end_time)
         
@@ -714,24 +1049,27 @@ def fetch_project_executions(
         end_date = format_timestamp(current_end)
         batch_label = f"Batch {batch_num}: {start_date} to {end_date}"
         
-        print(f"\n  {batch_label}")
+        print(f"  [{project_id}] {batch_label}")
         
         # Fetch this batch
-        batch_records = fetch_project_executions_batch(
+        batch_count = fetch_project_executions_batch(
+            session=session,
             base_url=base_url,
-            auth_token=auth_token,
             account_id=account_id,
             org_id=org_id,
             project_id=project_id,
             page_size=page_size,
             start_time=current_start,
             end_time=current_end,
-            api_key=api_key,
-            batch_label=batch_label
+            writer=writer,
+            context=context,
+            batch_label=batch_label,
+            prefetch_pages=concurrency,
+            initial_page=probe_data if single_batch else None
         )
         
-        all_records.extend(batch_records)
-        print(f"  Batch {batch_num} complete: {len(batch_records)} production stage records")
+        project_count += batch_count
+        print(f"  [{project_id}] Batch {batch_num} complete: {batch_count} production stage records")
         
         # Move to next batch (add 1ms to avoid overlap since end_time is inclusive)
         current_start = current_end + 1
@@ -739,10 +1077,9 @@ def fetch_project_executions(
         
         # Add delay between batches
         if current_start < end_time:
-            delay = random.uniform(0.5, 1.0)
-            time.sleep(delay)
+            throttle.wait()
     
-    return all_records
+    return project_count
 
 
 def main():
@@ -762,74 +1099,92 @@ def main():
     print(f"Page size: {args.page_size}")
     print(f"Time range: {format_timestamp(args.start_time)} to {format_timestamp(args.end_time)}")
     print(f"Time range (epoch): {args.start_time} to {args.end_time}")
-    print(f"Delay between calls: random 0.5-1.0s")
+    print(f"Delay between calls: adaptive, {throttle.min_delay}-{throttle.max_delay}s")
+    print(f"Concurrent page fetches: {args.concurrency}")
+    print(f"Concurrent projects: {args.project_workers}")
+    print(f"JSON backend: {JSON_BACKEND}")
     print()
     
+    # One pooled connection per worker thread that can have a request in flight
+    session = create_session(
+        auth_token=args.auth_token,
+        api_key=args.api_key,
+        pool_size=args.project_workers * args.concurrency
+    )
+    
     total_records = 0
-    csv_initialized = False
     
-    # Determine which projects to process
-    if args.project_id:
-        # Single project mode
-        projects = [args.project_id]
-    else:
-        # Fetch all projects
-        all_projects = fetch_all_projects(
-            base_url=base_url,
-            auth_token=args.auth_token,
-            account_id=args.account_id,
-            org_id=args.org_id,
-            api_key=args.api_key
-        )
-        # Filter out excluded projects
-        projects = [p for p in all_projects if p not in args.exclude_projects]
-        if args.exclude_projects:
-            excluded_count = len(all_projects) - len(projects)
-            print(f"Excluded {excluded_count} project(s)")
-        print()
-    
-    # Process each project
-    for idx, project_id in enumerate(projects, 1):
-        print(f"[{idx}/{len(projects)}] Processing project: {project_id}")
-        
-        project_records = fetch_project_executions(
-            base_url=base_url,
-            auth_token=args.auth_token,
-            account_id=args.account_id,
-            org_id=args.org_id,
-            project_id=project_id,
-            page_size=args.page_size,
-            start_time=args.start_time,
-            end_time=args.end_time,
-            api_key=args.api_key
-        )
+    try:
+        # Determine which projects to process
+        if args.project_id:
+            # Single project mode
+            projects = [args.project_id]
+        else:
+            # Fetch all projects
+            all_projects = fetch_all_projects(
+                session=session,
+                base_url=base_url,
+                account_id=args.account_id,
+                org_id=args.org_id,
+                concurrency=args.concurrency
+            )
+            # Filter out excluded projects
+            projects = [p for p in all_projects if p not in args.exclude_projects]
+            if args.exclude_projects:
+                excluded_count = len(all_projects) - len(projects)
+                print(f"Excluded {excluded_count} project(s)")
+            print()
         
-        # Write to CSV incrementally
-        if project_records:
-            if not csv_initialized:
-                # First write - create file with header
-                write_to_csv(project_records, args.output, mode='w')
-                csv_initialized = True
-            else:
-                # Subsequent writes - append without header
-                write_to_csv(project_records, args.output, mode='a')
+        # Keep the report open for the whole run and stream records into it
+        with CsvStreamWriter(args.output, FIELDNAMES) as writer:
+            print(f"Created CSV file: {args.output}")
+            print()
             
-            total_records += len(project_records)
-        
-        print(f"  Found {len(project_records)} production stage records for project {project_id}")
-        print(f"  Total records written so far: {total_records}")
-        print()
-        
-        # Add random delay between projects (except for the last one)
-        if idx < len(projects):
-            delay = random.uniform(0.5, 1.0)
-            time.sleep(delay)
+            # Process projects in parallel; rows from different projects interleave page by
+            # page (--project-workers 1 keeps them grouped in project order)
+            with ThreadPoolExecutor(max_workers=args.project_workers) as executor:
+                futures = {
+                    executor.submit(
+                        fetch_project_executions,
+                        session=session,
+                        base_url=base_url,
+                        account_id=args.account_id,
+                        org_id=args.org_id,
+                        project_id=project_id,
+                        page_size=args.page_size,
+                        start_time=args.start_time,
+                        end_time=args.end_time,
+                        writer=writer,
+                        concurrency=args.concurrency
+                    ): project_id
+                    for project_id in projects
+                }
+                
+                try:
+                    for idx, future in enumerate(as_completed(futures), 1):
+                        project_id = futures[future]
+                        project_count = future.result()
+                        total_records += project_count
+                        
+                        print(f"[{idx}/{len(projects)}] Finished project: {project_id}")
+                        print(f"  Found {project_count} production stage records for project {project_id}")
+                        print(f"  Total records written so far: {total_records}")
+                        print()
+                except BaseException:
+                    # Stop on the first failure or Ctrl-C: drop queued projects and
+                    # signal running ones to unwind at their next page
+                    stop_event.set()
+                    for future in futures:
+                        future.cancel()
+                    raise
+    finally:
+        session.close()
     
     print(f"Total production stage records collected: {total_records}")
     if total_records > 0:
         print(f"All records saved to: {args.output}")
     else:
-        print("No records to write.")
+        print("No production stage records found.")
 
 
 if __name__ == '__main__':